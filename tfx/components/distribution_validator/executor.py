@@ -13,17 +13,23 @@
 # limitations under the License.
 """TFX DistributionValidator executor."""
 
+import collections
+import concurrent.futures
+import itertools
+import multiprocessing
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from absl import logging
 import tensorflow_data_validation as tfdv
+from tensorflow_data_validation.anomalies.proto import custom_validation_config_pb2
 from tensorflow_data_validation.utils import path
 from tensorflow_data_validation.utils import schema_util
 from tfx import types
 from tfx.components.distribution_validator import utils
 from tfx.components.statistics_gen import stats_artifact_utils
 from tfx.dsl.components.base import base_executor
+from tfx.dsl.io import fileio
 from tfx.proto import distribution_validator_pb2
 from tfx.proto.orchestration import execution_result_pb2
 from tfx.types import artifact_utils
@@ -32,6 +38,7 @@ from tfx.utils import json_utils
 from tfx.utils import monitoring_utils
 from tfx.utils import writer_utils
 
+from google.protobuf.internal import api_implementation
 from tensorflow_metadata.proto.v0 import anomalies_pb2
 from tensorflow_metadata.proto.v0 import schema_pb2
 from tensorflow_metadata.proto.v0 import statistics_pb2
@@ -47,7 +54,17 @@ BLESSED_VALUE = 1
 NOT_BLESSED_VALUE = 0
 NO_BASELINE_STATS = 2
 
-_COMPARISON_ANOMALY_TYPES = frozenset([
+# Maximum number of concurrent anomalies writes per group of split pairs.
+_MAX_ANOMALIES_WRITERS = 4
+
+# Minimum total size of the statistics to validate for split pairs to be
+# validated in worker processes. Each spawned worker imports TFDV again, which
+# takes seconds, so smaller inputs are validated in the executor process.
+_MIN_STATISTICS_BYTES_FOR_WORKERS = 256 * 1024 * 1024
+
+# Enum values of protobuf messages are plain ints in Python, so membership tests
+# against `reason.type` only hash integers.
+_COMPARISON_ANOMALY_TYPES: FrozenSet[int] = frozenset([
     anomalies_pb2.AnomalyInfo.Type.COMPARATOR_CONTROL_DATA_MISSING,
     anomalies_pb2.AnomalyInfo.Type.COMPARATOR_TREATMENT_DATA_MISSING,
     anomalies_pb2.AnomalyInfo.Type.COMPARATOR_L_INFTY_HIGH,
@@ -60,44 +77,58 @@ _COMPARISON_ANOMALY_TYPES = frozenset([
 ])
 
 
+def _copy_anomaly_info(
+    info: anomalies_pb2.AnomalyInfo,
+    reasons: List[anomalies_pb2.AnomalyInfo.Reason],
+    new_info: anomalies_pb2.AnomalyInfo,
+) -> None:
+  """Copies the path and severity of an AnomalyInfo along with given reasons."""
+  if info.HasField('path'):
+    new_info.path.CopyFrom(info.path)
+  if info.HasField('severity'):
+    new_info.severity = info.severity
+  new_info.reason.extend(reasons)
+
+
 def _get_comparison_only_anomalies(
     anomalies: anomalies_pb2.Anomalies,
 ) -> anomalies_pb2.Anomalies:
   """Returns new Anomalies proto with only info from statistics comparison."""
+  # The new proto is built field by field rather than copied and pruned, so
+  # that entries which would be removed are never copied.
   new_anomalies = anomalies_pb2.Anomalies()
-  new_anomalies.CopyFrom(anomalies)
-  for feature in list(new_anomalies.anomaly_info):
-    # Remove top-level anomaly info description, short_description, and
-    # diff_regions entries, since we don't have a good way of separating out the
-    # comparison-related portion from the rest.
-    new_anomalies.anomaly_info[feature].ClearField('description')
-    new_anomalies.anomaly_info[feature].ClearField('short_description')
-    new_anomalies.anomaly_info[feature].ClearField('diff_regions')
+  baseline_field = anomalies.WhichOneof('baseline_schema')
+  if baseline_field is not None:
+    getattr(new_anomalies, baseline_field).CopyFrom(
+        getattr(anomalies, baseline_field)
+    )
+  if anomalies.HasField('anomaly_name_format'):
+    new_anomalies.anomaly_name_format = anomalies.anomaly_name_format
+  new_anomalies.drift_skew_info.extend(anomalies.drift_skew_info)
+  for feature, info in anomalies.anomaly_info.items():
+    # Top-level anomaly info description, short_description, and diff_regions
+    # entries are not copied, since we don't have a good way of separating out
+    # the comparison-related portion from the rest.
     reasons_to_keep = [
-        r
-        for r in new_anomalies.anomaly_info[feature].reason
-        if r.type in _COMPARISON_ANOMALY_TYPES
+        r for r in info.reason if r.type in _COMPARISON_ANOMALY_TYPES
     ]
-    del new_anomalies.anomaly_info[feature].reason[:]
-    new_anomalies.anomaly_info[feature].reason.extend(reasons_to_keep)
-    # If all of the reasons have been removed, remove the feature's entry from
-    # anomaly_info altogether.
-    if not new_anomalies.anomaly_info[feature].reason:
-      del new_anomalies.anomaly_info[feature]
-  new_anomalies.dataset_anomaly_info.ClearField('description')
-  new_anomalies.dataset_anomaly_info.ClearField('short_description')
-  new_anomalies.dataset_anomaly_info.ClearField('diff_regions')
+    # If none of the reasons are kept, the feature gets no entry in
+    # anomaly_info at all.
+    if reasons_to_keep:
+      _copy_anomaly_info(
+          info, reasons_to_keep, new_anomalies.anomaly_info[feature]
+      )
   dataset_reasons_to_keep = [
       r
-      for r in new_anomalies.dataset_anomaly_info.reason
+      for r in anomalies.dataset_anomaly_info.reason
       if r.type in _COMPARISON_ANOMALY_TYPES
   ]
-  del new_anomalies.dataset_anomaly_info.reason[:]
   if dataset_reasons_to_keep:
-    new_anomalies.dataset_anomaly_info.reason.extend(dataset_reasons_to_keep)
-  else:
-    new_anomalies.ClearField('dataset_anomaly_info')
-  new_anomalies.ClearField('data_missing')
+    _copy_anomaly_info(
+        anomalies.dataset_anomaly_info,
+        dataset_reasons_to_keep,
+        new_anomalies.dataset_anomaly_info,
+    )
   return new_anomalies
 
 
@@ -128,36 +159,37 @@ def _make_schema_from_config(
 
 
 def _add_anomalies_for_missing_comparisons(
-    raw_anomalies: anomalies_pb2.Anomalies,
+    anomalies: anomalies_pb2.Anomalies,
     config: distribution_validator_pb2.DistributionValidatorConfig,
 ) -> anomalies_pb2.Anomalies:
   """Identifies whether comparison could be done on the configured features.
 
   If comparison was not done for a configured feature, adds an anomaly flagging
-  that.
+  that. The given Anomalies proto is modified in place.
 
   Args:
-    raw_anomalies: The Anomalies proto to be checked for comparison.
+    anomalies: The Anomalies proto to be checked for comparison.
     config: The config that identifies the features for which distribution
       validation will be done.
 
   Returns:
-    An Anomalies proto with anomalies added for features for which comparisons
-    could not be done.
+    The given Anomalies proto with anomalies added for features for which
+    comparisons could not be done.
   """
-  compared_features = set(
-      ['.'.join(info.path.step) for info in raw_anomalies.drift_skew_info]
-  )
-  anomalies = anomalies_pb2.Anomalies()
-  anomalies.CopyFrom(raw_anomalies)
   anomalies.anomaly_name_format = (
       anomalies_pb2.Anomalies.AnomalyNameFormat.SERIALIZED_PATH
   )
+  if not config.default_slice_config.feature:
+    return anomalies
+  compared_features = {
+      '.'.join(info.path.step) for info in anomalies.drift_skew_info
+  }
   for feature in config.default_slice_config.feature:
-    if '.'.join(feature.path.step) in compared_features:
-      continue
     feature_key = '.'.join(feature.path.step)
-    reason = anomalies.anomaly_info[feature_key].reason.add()
+    if feature_key in compared_features:
+      continue
+    anomaly_info = anomalies.anomaly_info[feature_key]
+    reason = anomaly_info.reason.add()
     # TODO(b/239734255): Update with new anomaly type.
     reason.type = anomalies_pb2.AnomalyInfo.Type.STATS_NOT_AVAILABLE
     reason.short_description = 'Comparison could not be done.'
@@ -166,10 +198,8 @@ def _add_anomalies_for_missing_comparisons(
         'due to missing data, use of a comparator that is not suitable for the '
         'feature type, or some other reason.'
     )
-    anomalies.anomaly_info[feature_key].path.CopyFrom(feature.path)
-    anomalies.anomaly_info[feature_key].severity = (
-        anomalies_pb2.AnomalyInfo.Severity.ERROR
-    )
+    anomaly_info.path.CopyFrom(feature.path)
+    anomaly_info.severity = anomalies_pb2.AnomalyInfo.Severity.ERROR
   return anomalies
 
 
@@ -210,6 +240,122 @@ def _get_distribution_validator_config(
   return config
 
 
+def _validate_split_pairs(
+    baseline_split: str,
+    baseline_stats_path: str,
+    test_stats_paths: Sequence[Tuple[str, str]],
+    span: int,
+    config_bytes: bytes,
+    custom_validation_config_bytes: Optional[bytes],
+    anomalies_uri: str,
+    validation_metrics_artifact: Optional[types.Artifact],
+) -> List[Tuple[str, int]]:
+  """Validates split pairs sharing a baseline split and writes anomalies.
+
+  The baseline statistics and the schema inferred from them are loaded once and
+  reused for every test split. This may run in a worker process, so statistics
+  are passed as file paths and configs as serialized protos.
+
+  Args:
+    baseline_split: The baseline split to compare against.
+    baseline_stats_path: The path of the statistics of `baseline_split`.
+    test_stats_paths: For each test split to validate, a tuple of the split
+      name and the path of its statistics.
+    span: The span of the test statistics.
+    config_bytes: A serialized DistributionValidatorConfig.
+    custom_validation_config_bytes: A serialized CustomValidationConfig, or
+      None if no custom validation is configured.
+    anomalies_uri: The URI of the output anomalies artifact.
+    validation_metrics_artifact: The output validation metrics artifact, if
+      any. Monitoring metrics are generated for each split pair right after it
+      is validated, so that its statistics need not be loaded again. In a
+      worker process this is a copy of the output artifact.
+
+  Returns:
+    A list with, for each test split, a tuple of the split pair name and its
+    blessed value.
+  """
+  config = distribution_validator_pb2.DistributionValidatorConfig.FromString(
+      config_bytes
+  )
+  custom_validation_config = None
+  if custom_validation_config_bytes is not None:
+    custom_validation_config = (
+        custom_validation_config_pb2.CustomValidationConfig.FromString(
+            custom_validation_config_bytes
+        )
+    )
+  baseline_stats_split = stats_artifact_utils.load_statistics_from_path(
+      baseline_stats_path
+  ).proto()
+  schema = _make_schema_from_config(config, baseline_stats_split)
+
+  results = []
+  # With several test splits, anomalies are written in the background so that
+  # writing to (possibly remote) storage overlaps with validating the next
+  # split pair. A single anomalies output is written directly.
+  write_pool = None
+  if len(test_stats_paths) > 1:
+    write_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(_MAX_ANOMALIES_WRITERS, len(test_stats_paths))
+    )
+  try:
+    write_futures = []
+    for test_split, test_stats_path in test_stats_paths:
+      split_pair = '%s_%s' % (test_split, baseline_split)
+      logging.info('Processing split pair %s', split_pair)
+      test_stats_split = stats_artifact_utils.load_statistics_from_path(
+          test_stats_path
+      ).proto()
+
+      full_anomalies = tfdv.validate_statistics(
+          test_stats_split,
+          schema,
+          previous_statistics=baseline_stats_split,
+          custom_validation_config=custom_validation_config,
+      )
+      anomalies = _get_comparison_only_anomalies(full_anomalies)
+      anomalies = _add_anomalies_for_missing_comparisons(anomalies, config)
+
+      if anomalies.anomaly_info or anomalies.HasField('dataset_anomaly_info'):
+        blessed_value = NOT_BLESSED_VALUE
+      else:
+        blessed_value = BLESSED_VALUE
+
+      anomalies_path = os.path.join(
+          anomalies_uri, 'SplitPair-%s' % split_pair, DEFAULT_FILE_NAME
+      )
+      # Serializing here lets the writer thread work on bytes only, and lets
+      # the proto be released right away.
+      if write_pool is None:
+        writer_utils.write_anomalies_bytes(
+            anomalies_path, anomalies.SerializeToString()
+        )
+      else:
+        write_futures.append(
+            write_pool.submit(
+                writer_utils.write_anomalies_bytes,
+                anomalies_path,
+                anomalies.SerializeToString(),
+            )
+        )
+      monitoring_utils.generate_monitoring_metrics(
+          test_stats_split,
+          baseline_stats_split,
+          split_pair,
+          span,
+          validation_metrics_artifact,
+      )
+      results.append((split_pair, blessed_value))
+    # Surfaces any error raised while writing.
+    for future in write_futures:
+      future.result()
+  finally:
+    if write_pool is not None:
+      write_pool.shutdown()
+  return results
+
+
 class Executor(base_executor.BaseExecutor):
   """DistributionValidator component executor."""
 
@@ -233,6 +379,15 @@ class Executor(base_executor.BaseExecutor):
       ExecutionResult proto with anomalies
     """
     self._log_startup(input_dict, output_dict, exec_properties)
+    if api_implementation.Type() == 'python':
+      # Validation copies and walks large statistics and anomalies protos,
+      # which is an order of magnitude slower without a native backend.
+      logging.warning(
+          'The pure Python protobuf implementation is in use, which makes'
+          ' distribution validation considerably slower. Install protobuf'
+          ' with a native (upb or cpp) backend and do not set'
+          ' PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python.'
+      )
 
     # Load and deserialize include splits from execution properties.
     include_splits_list = (
@@ -244,7 +399,6 @@ class Executor(base_executor.BaseExecutor):
         or []
     )
     include_splits = set((test, base) for test, base in include_splits_list)
-    blessed_value_dict = {}
     executor_output = execution_result_pb2.ExecutorOutput()
 
     anomalies_artifact = artifact_utils.get_single_instance(
@@ -254,6 +408,9 @@ class Executor(base_executor.BaseExecutor):
     test_statistics = artifact_utils.get_single_instance(
         input_dict[standard_component_specs.STATISTICS_KEY]
     )
+    test_split_names = artifact_utils.decode_split_names(
+        test_statistics.split_names
+    )
     if input_dict[standard_component_specs.BASELINE_STATISTICS_KEY]:
       baseline_statistics = artifact_utils.get_single_instance(
           input_dict[standard_component_specs.BASELINE_STATISTICS_KEY]
@@ -263,10 +420,7 @@ class Executor(base_executor.BaseExecutor):
           'No baseline statistics found. Rubber stamping distribution'
           ' validation for all splits.'
       )
-      for split in artifact_utils.decode_split_names(
-          test_statistics.split_names
-      ):
-        blessed_value_dict[split] = NO_BASELINE_STATS
+      blessed_value_dict = dict.fromkeys(test_split_names, NO_BASELINE_STATS)
       anomalies_artifact.set_json_value_custom_property(
           ARTIFACT_PROPERTY_BLESSED_KEY, blessed_value_dict
       )
@@ -283,17 +437,36 @@ class Executor(base_executor.BaseExecutor):
     )
 
     # Set up pairs of splits to validate.
-    split_pairs = []
-    for test_split in artifact_utils.decode_split_names(
-        test_statistics.split_names
-    ):
-      for baseline_split in artifact_utils.decode_split_names(
-          baseline_statistics.split_names
-      ):
-        if (test_split, baseline_split) in include_splits:
-          split_pairs.append((test_split, baseline_split))
-        elif not include_splits and test_split == baseline_split:
-          split_pairs.append((test_split, baseline_split))
+    baseline_split_names = artifact_utils.decode_split_names(
+        baseline_statistics.split_names
+    )
+    if include_splits:
+      # Pairs are ordered by the position of their splits in the artifacts.
+      test_split_indices = {
+          split: i for i, split in enumerate(test_split_names)
+      }
+      baseline_split_indices = {
+          split: i for i, split in enumerate(baseline_split_names)
+      }
+      split_pairs = sorted(
+          (
+              (test_split, baseline_split)
+              for test_split, baseline_split in include_splits
+              if test_split in test_split_indices
+              and baseline_split in baseline_split_indices
+          ),
+          key=lambda pair: (
+              test_split_indices[pair[0]],
+              baseline_split_indices[pair[1]],
+          ),
+      )
+    else:
+      baseline_split_name_set = set(baseline_split_names)
+      split_pairs = [
+          (split, split)
+          for split in test_split_names
+          if split in baseline_split_name_set
+      ]
     if not split_pairs:
       raise ValueError(
           'No split pairs from test and baseline statistics: %s, %s'
@@ -310,9 +483,13 @@ class Executor(base_executor.BaseExecutor):
             ])
         )
 
-    anomalies_artifact.split_names = artifact_utils.encode_split_names(
-        ['%s_%s' % (test, baseline) for test, baseline in split_pairs]
+    split_pair_names = [
+        '%s_%s' % (test, baseline) for test, baseline in split_pairs
+    ]
+    encoded_split_pair_names = artifact_utils.encode_split_names(
+        split_pair_names
     )
+    anomalies_artifact.split_names = encoded_split_pair_names
     anomalies_artifact.span = test_statistics.span
 
     validation_metrics_artifact = None
@@ -320,52 +497,92 @@ class Executor(base_executor.BaseExecutor):
       validation_metrics_artifact = artifact_utils.get_single_instance(
           output_dict[standard_component_specs.VALIDATION_METRICS_KEY]
       )
-      validation_metrics_artifact.split_names = (
-          artifact_utils.encode_split_names(
-              ['%s_%s' % (test, baseline) for test, baseline in split_pairs]
-          )
+      validation_metrics_artifact.split_names = encoded_split_pair_names
+    config_bytes = config.SerializeToString()
+    custom_validation_config_bytes = (
+        custom_validation_config.SerializeToString()
+        if custom_validation_config is not None
+        else None
+    )
+    test_stats_paths = {
+        split: stats_artifact_utils.get_statistics_path(test_statistics, split)
+        for split in set(test for test, _ in split_pairs)
+    }
+    baseline_stats_paths = {
+        split: stats_artifact_utils.get_statistics_path(
+            baseline_statistics, split
+        )
+        for split in set(baseline for _, baseline in split_pairs)
+    }
+    try:
+      num_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+      # os.sched_getaffinity is not available on all platforms.
+      num_cpus = os.cpu_count() or 1
+    max_workers = min(len(split_pairs), num_cpus)
+    if max_workers > 1:
+      stats_bytes = sum(
+          fileio.stat(path).length
+          for path in set(test_stats_paths.values())
+          | set(baseline_stats_paths.values())
       )
-    current_stats_span = test_statistics.span
+      if stats_bytes < _MIN_STATISTICS_BYTES_FOR_WORKERS:
+        max_workers = 1
+    # Pairs are grouped by baseline split so that the baseline statistics and
+    # the schema inferred from them are loaded once per group. With workers,
+    # groups are split into chunks of at most an even share of the pairs per
+    # worker, so that many test splits sharing one baseline (e.g. train and
+    # serving against eval) are still validated in parallel, at the cost of
+    # inferring the schema once per chunk.
+    chunk_size = -(-len(split_pairs) // max_workers)
+    test_splits_by_baseline_split = collections.defaultdict(list)
     for test_split, baseline_split in split_pairs:
-      split_pair = '%s_%s' % (test_split, baseline_split)
-      logging.info('Processing split pair %s', split_pair)
-      test_stats_split = stats_artifact_utils.load_statistics(
-          test_statistics, test_split
-      ).proto()
-      baseline_stats_split = stats_artifact_utils.load_statistics(
-          baseline_statistics, baseline_split
-      ).proto()
-
-      schema = _make_schema_from_config(config, baseline_stats_split)
-      full_anomalies = tfdv.validate_statistics(
-          test_stats_split,
-          schema,
-          previous_statistics=baseline_stats_split,
-          custom_validation_config=custom_validation_config,
+      test_splits_by_baseline_split[baseline_split].append(test_split)
+    validate_args = [
+        (
+            baseline_split,
+            baseline_stats_paths[baseline_split],
+            [
+                (test_split, test_stats_paths[test_split])
+                for test_split in test_splits[start : start + chunk_size]
+            ],
+            test_statistics.span,
+            config_bytes,
+            custom_validation_config_bytes,
+            anomalies_artifact.uri,
+            validation_metrics_artifact,
+        )
+        for baseline_split, test_splits in (
+            test_splits_by_baseline_split.items()
+        )
+        for start in range(0, len(test_splits), chunk_size)
+    ]
+    num_workers = min(len(validate_args), max_workers)
+    if num_workers <= 1:
+      results = list(
+          itertools.chain.from_iterable(
+              _validate_split_pairs(*args) for args in validate_args
+          )
       )
-      anomalies = _get_comparison_only_anomalies(full_anomalies)
-      anomalies = _add_anomalies_for_missing_comparisons(anomalies, config)
+    else:
+      # Tasks share no state, so they are validated in parallel. Workers are
+      # spawned rather than forked, since forking a process that has
+      # TensorFlow loaded and file system threads running can deadlock.
+      with concurrent.futures.ProcessPoolExecutor(
+          max_workers=num_workers,
+          mp_context=multiprocessing.get_context('spawn'),
+      ) as pool:
+        results = list(
+            itertools.chain.from_iterable(
+                pool.map(_validate_split_pairs, *zip(*validate_args))
+            )
+        )
 
-      if anomalies.anomaly_info or anomalies.HasField('dataset_anomaly_info'):
+    # Split pairs are blessed unless their validation found anomalies.
+    blessed_value_dict = dict.fromkeys(split_pair_names, BLESSED_VALUE)
+    for split_pair, blessed_value in results:
+      if blessed_value == NOT_BLESSED_VALUE:
         blessed_value_dict[split_pair] = NOT_BLESSED_VALUE
-      else:
-        blessed_value_dict[split_pair] = BLESSED_VALUE
-
-      writer_utils.write_anomalies(
-          os.path.join(
-              anomalies_artifact.uri,
-              'SplitPair-%s' % split_pair,
-              DEFAULT_FILE_NAME,
-          ),
-          anomalies,
-      )
-      monitoring_utils.generate_monitoring_metrics(
-          test_stats_split,
-          baseline_stats_split,
-          split_pair,
-          current_stats_span,
-          validation_metrics_artifact,
-      )
 
     # Set blessed custom property for Anomalies Artifact
     anomalies_artifact.set_json_value_custom_property(
@@ -16,6 +16,7 @@
 
 import os
 import tempfile
+from unittest import mock
 
 from absl import flags
 from absl.testing import parameterized
@@ -133,6 +134,189 @@ class ExecutorTest(parameterized.TestCase, test_case_utils.TfxTest):
         split_pair = output.split('SplitPair-')[1]
         self.assertIn(split_pair, expected_split_pair_names)
 
+  def testSplitPairNamesFollowArtifactSplitOrder(self):
+    source_data_dir = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), 'testdata'
+    )
+
+    stats_artifact = standard_artifacts.ExampleStatistics()
+    stats_artifact.uri = os.path.join(source_data_dir, 'statistics_gen')
+    stats_artifact.split_names = artifact_utils.encode_split_names(
+        ['train', 'eval']
+    )
+
+    output_data_dir = os.path.join(
+        os.environ.get('TEST_UNDECLARED_OUTPUTS_DIR', self.get_temp_dir()),
+        self._testMethodName,
+    )
+
+    anomalies_output = standard_artifacts.ExampleAnomalies()
+    anomalies_output.uri = os.path.join(output_data_dir, 'anomalies')
+    validation_metrics_output = standard_artifacts.ExampleValidationMetrics()
+    validation_metrics_output.uri = os.path.join(
+        output_data_dir, 'validation_metrics'
+    )
+
+    input_dict = {
+        standard_component_specs.STATISTICS_KEY: [stats_artifact],
+        standard_component_specs.BASELINE_STATISTICS_KEY: [stats_artifact],
+    }
+
+    # Split pairs are listed in the reverse of the artifact split order.
+    exec_properties = {
+        # List needs to be serialized before being passed into Do function.
+        standard_component_specs.INCLUDE_SPLIT_PAIRS_KEY: json_utils.dumps([
+            ('eval', 'eval'),
+            ('eval', 'train'),
+            ('train', 'eval'),
+            ('train', 'train'),
+        ]),
+        standard_component_specs.DISTRIBUTION_VALIDATOR_CONFIG_KEY: (
+            distribution_validator_pb2.DistributionValidatorConfig()
+        ),
+    }
+
+    output_dict = {
+        standard_component_specs.ANOMALIES_KEY: [anomalies_output],
+        standard_component_specs.VALIDATION_METRICS_KEY: [
+            validation_metrics_output
+        ],
+    }
+
+    distribution_validator_executor = executor.Executor()
+    distribution_validator_executor.Do(
+        input_dict, output_dict, exec_properties
+    )
+
+    # Pairs are ordered by test split, then by baseline split, each following
+    # the order of the splits in the statistics artifacts.
+    expected_split_names = artifact_utils.encode_split_names(
+        ['train_train', 'train_eval', 'eval_train', 'eval_eval']
+    )
+    self.assertEqual(expected_split_names, anomalies_output.split_names)
+    self.assertEqual(
+        expected_split_names, validation_metrics_output.split_names
+    )
+
+  @parameterized.named_parameters(
+      {
+          'testcase_name': 'different_baselines',
+          'split_pairs': [
+              ('train', 'train'),
+              ('train', 'eval'),
+              ('eval', 'train'),
+              ('eval', 'eval'),
+          ],
+          'expected_blessed_values': {
+              'train_train': executor.BLESSED_VALUE,
+              'train_eval': executor.NOT_BLESSED_VALUE,
+              'eval_train': executor.NOT_BLESSED_VALUE,
+              'eval_eval': executor.BLESSED_VALUE,
+          },
+      },
+      {
+          'testcase_name': 'shared_baseline',
+          'split_pairs': [('train', 'eval'), ('eval', 'eval')],
+          'expected_blessed_values': {
+              'train_eval': executor.NOT_BLESSED_VALUE,
+              'eval_eval': executor.BLESSED_VALUE,
+          },
+      },
+  )
+  def testValidateSplitPairsInParallel(
+      self, split_pairs, expected_blessed_values
+  ):
+    source_data_dir = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), 'testdata'
+    )
+
+    stats_artifact = standard_artifacts.ExampleStatistics()
+    stats_artifact.uri = os.path.join(source_data_dir, 'statistics_gen')
+    stats_artifact.split_names = artifact_utils.encode_split_names(
+        ['train', 'eval']
+    )
+
+    validation_config = text_format.Parse(
+        """
+      default_slice_config: {
+        feature: {
+            path: {
+                step: 'company'
+            }
+            distribution_comparator: {
+              infinity_norm: {
+                  threshold: 0.0
+              }
+            }
+        }
+      }""",
+        distribution_validator_pb2.DistributionValidatorConfig(),
+    )
+
+    output_data_dir = os.path.join(
+        os.environ.get('TEST_UNDECLARED_OUTPUTS_DIR', self.get_temp_dir()),
+        self._testMethodName,
+    )
+
+    anomalies_output = standard_artifacts.ExampleAnomalies()
+    anomalies_output.uri = os.path.join(output_data_dir, 'anomalies')
+    validation_metrics_output = standard_artifacts.ExampleValidationMetrics()
+    validation_metrics_output.uri = os.path.join(
+        output_data_dir, 'validation_metrics'
+    )
+
+    input_dict = {
+        standard_component_specs.STATISTICS_KEY: [stats_artifact],
+        standard_component_specs.BASELINE_STATISTICS_KEY: [stats_artifact],
+    }
+
+    exec_properties = {
+        # List needs to be serialized before being passed into Do function.
+        standard_component_specs.INCLUDE_SPLIT_PAIRS_KEY: json_utils.dumps(
+            split_pairs
+        ),
+        standard_component_specs.DISTRIBUTION_VALIDATOR_CONFIG_KEY: (
+            validation_config
+        ),
+    }
+
+    output_dict = {
+        standard_component_specs.ANOMALIES_KEY: [anomalies_output],
+        standard_component_specs.VALIDATION_METRICS_KEY: [
+            validation_metrics_output
+        ],
+    }
+
+    # Several split pairs are validated in separate worker processes, where
+    # more than one CPU is available, regardless of the size of the statistics.
+    with mock.patch.object(executor, '_MIN_STATISTICS_BYTES_FOR_WORKERS', 0):
+      distribution_validator_executor = executor.Executor()
+      distribution_validator_executor.Do(
+          input_dict, output_dict, exec_properties
+      )
+
+    # Only pairs of different splits have a distance above the threshold.
+    self.assertEqual(
+        anomalies_output.get_json_value_custom_property(
+            executor.ARTIFACT_PROPERTY_BLESSED_KEY
+        ),
+        expected_blessed_values,
+    )
+    for split_pair, blessed_value in expected_blessed_values.items():
+      distribution_anomalies_path = os.path.join(
+          anomalies_output.uri, 'SplitPair-' + split_pair, 'SchemaDiff.pb'
+      )
+      self.assertTrue(fileio.exists(distribution_anomalies_path))
+      distribution_anomalies = anomalies_pb2.Anomalies.FromString(
+          io_utils.read_bytes_file(distribution_anomalies_path)
+      )
+      if blessed_value == executor.BLESSED_VALUE:
+        self.assertEmpty(distribution_anomalies.anomaly_info)
+      else:
+        self.assertCountEqual(
+            ['company'], distribution_anomalies.anomaly_info.keys()
+        )
+
   @parameterized.named_parameters(
       {
           'testcase_name': 'multiple_features',
@@ -25,12 +25,24 @@ TFRECORD_BASENAME = 'stats_tfrecord'
 SHARDED_STATS_PREFIX = 'FeatureStats'
 
 
-def load_statistics(stats_artifact: artifact.Artifact,
-                    split: str) -> tfdv.DatasetListView:
+def get_statistics_path(stats_artifact: artifact.Artifact, split: str) -> str:
+  """Returns the path of the statistics file of a split of an artifact."""
   stats_dir = artifact_utils.get_split_uri([stats_artifact], split)
   if artifact_utils.is_artifact_version_older_than(
       stats_artifact, artifact_utils._ARTIFACT_VERSION_FOR_STATS_UPDATE):  # pylint: disable=protected-access
-    stats = tfdv.load_statistics(os.path.join(stats_dir, TFRECORD_BASENAME))
+    return os.path.join(stats_dir, TFRECORD_BASENAME)
+  return os.path.join(stats_dir, BINARY_PB_BASENAME)
+
+
+def load_statistics_from_path(stats_path: str) -> tfdv.DatasetListView:
+  """Loads statistics from a path returned by `get_statistics_path`."""
+  if os.path.basename(stats_path) == TFRECORD_BASENAME:
+    stats = tfdv.load_statistics(stats_path)
   else:
-    stats = tfdv.load_stats_binary(os.path.join(stats_dir, BINARY_PB_BASENAME))
+    stats = tfdv.load_stats_binary(stats_path)
   return tfdv.DatasetListView(stats)
+
+
+def load_statistics(stats_artifact: artifact.Artifact,
+                    split: str) -> tfdv.DatasetListView:
+  return load_statistics_from_path(get_statistics_path(stats_artifact, split))
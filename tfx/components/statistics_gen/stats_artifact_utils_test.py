@@ -39,3 +39,13 @@ class StatsArtifactUtilsTest(tf.test.TestCase):
         ValueError,
         'Split does not exist over all example artifacts: not_a_split'):
       stats_artifact_utils.load_statistics(stats_artifact, 'not_a_split')
+
+  def testGetStatisticsPath(self):
+    stats_artifact = standard_artifacts.ExampleStatistics()
+    stats_artifact.uri = '/stats'
+    stats_artifact.split_names = artifact_utils.encode_split_names(['train'])
+
+    self.assertEqual(
+        os.path.join('/stats', 'Split-train',
+                     stats_artifact_utils.BINARY_PB_BASENAME),
+        stats_artifact_utils.get_statistics_path(stats_artifact, 'train'))
@@ -14,7 +14,8 @@
 """Utils for TFX component types. Intended for internal usage only."""
 
 import inspect
-from typing import Any, Callable, Mapping, Optional, Type
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Type
+import weakref
 
 from tfx import types
 from tfx.dsl.component.experimental import json_compat
@@ -54,6 +55,97 @@ def _convert_function_to_python_executable_spec(
   )
 
 
+# Allowed execution hook parameter types per component spec class. Built once
+# per spec class and shared by all of its execution hook functions.
+_ALLOWED_PARAM_TYPES_CACHE: MutableMapping[
+    type[component_spec.ComponentSpec], Dict[str, Optional[List[Any]]]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_allowed_param_types(
+    spec: type[component_spec.ComponentSpec],
+) -> Dict[str, Optional[List[Any]]]:
+  """Returns the allowed parameter types for each key of the component spec.
+
+  A value of None marks a JsonValue artifact input, whose parameter can be
+  annotated with any JSON compatible type.
+
+  Args:
+    spec: A component spec.
+  """
+  if spec in _ALLOWED_PARAM_TYPES_CACHE:
+    return _ALLOWED_PARAM_TYPES_CACHE[spec]
+
+  result = {}
+  for param_name, exec_prop in spec.PARAMETERS.items():
+    result[param_name] = [
+        Optional[exec_prop.type] if exec_prop.optional else exec_prop.type
+    ]
+  for parameters in (spec.INPUTS, spec.OUTPUTS):
+    for param_name, channel in parameters.items():
+      if not issubclass(channel.type, standard_artifacts.ValueArtifact):
+        result[param_name] = [
+            list[channel.type],
+            Optional[channel.type] if channel.optional else channel.type,
+        ]
+      elif param_name in spec.INPUTS:
+        if channel.type in _VALUE_ARTIFACT_TO_TYPE:
+          # Primitvie ValueArtifact input can be annotated as a primitive type.
+          primitive_type = _VALUE_ARTIFACT_TO_TYPE[channel.type]
+          result[param_name] = [
+              Optional[primitive_type] if channel.optional else primitive_type
+          ]
+        else:
+          # JsonValue artifact type.
+          result[param_name] = None
+      else:
+        result[param_name] = []
+
+  _ALLOWED_PARAM_TYPES_CACHE[spec] = result
+  return result
+
+
+def _get_param_annotations(fn: Callable[..., Any]) -> Dict[str, Any]:
+  """Returns the annotation of each parameter, in signature order.
+
+  Plain functions are read from their code object and `__annotations__`, which
+  is much cheaper than building an `inspect.Signature`. Other callables, such as
+  bound methods whose code object still lists `self` or `cls`, go through
+  `inspect.signature`. Parameters without an annotation map to
+  `inspect.Signature.empty`.
+
+  Args:
+    fn: A callable.
+  """
+  if (not inspect.isfunction(fn) or hasattr(fn, '__wrapped__') or
+      hasattr(fn, '__signature__')):
+    signature = inspect.signature(fn)
+    return {
+        name: parameter.annotation
+        for name, parameter in signature.parameters.items()
+    }
+  code = fn.__code__
+  # `co_varnames` lists positional parameters, then keyword-only parameters,
+  # then `*args` and `**kwargs`, whereas a signature has `*args` before the
+  # keyword-only parameters.
+  num_positional = code.co_argcount
+  num_keyword_only = code.co_kwonlyargcount
+  param_names = list(code.co_varnames[:num_positional])
+  next_index = num_positional + num_keyword_only
+  if code.co_flags & inspect.CO_VARARGS:
+    param_names.append(code.co_varnames[next_index])
+    next_index += 1
+  param_names.extend(
+      code.co_varnames[num_positional:num_positional + num_keyword_only])
+  if code.co_flags & inspect.CO_VARKEYWORDS:
+    param_names.append(code.co_varnames[next_index])
+  annotations = fn.__annotations__
+  return {
+      name: annotations.get(name, inspect.Signature.empty)
+      for name in param_names
+  }
+
+
 def _type_check_execution_function_params(
     spec: type[component_spec.ComponentSpec],
     fn: Optional[Callable[..., Any]] = None,
@@ -71,72 +163,36 @@ def _type_check_execution_function_params(
   if fn is None:
     return
 
-  channel_parameters = {}
-  for parameters in (spec.INPUTS, spec.OUTPUTS):
-    channel_parameters.update(parameters)
-  signature = inspect.signature(fn)
+  allowed_param_types_by_name = _get_allowed_param_types(spec)
 
   # Execution function type check.
-  for param_name in signature.parameters:
-    param_type = signature.parameters[param_name].annotation
+  for param_name, param_type in _get_param_annotations(fn).items():
     if param_type is inspect.Signature.empty:
       raise TypeError(
           f'Execution hook function parameter "{param_name}" should be'
           ' annotated.'
       )
 
-    if param_name in channel_parameters:
-      channel = channel_parameters[param_name]
-      allowed_param_types = []
-
-      if not issubclass(channel.type, standard_artifacts.ValueArtifact):
+    if param_name in allowed_param_types_by_name:
+      allowed_param_types = allowed_param_types_by_name[param_name]
+      if allowed_param_types is None:
+        # JsonValue artifact type.
+        channel = spec.INPUTS[param_name]
+        is_param_optional, inner_param_type = (
+            pure_typing_utils.maybe_unwrap_optional(param_type)
+        )
+        if (
+            json_compat.is_json_compatible(inner_param_type)
+            and is_param_optional == channel.optional
+        ):
+          continue  # Type check okay
         allowed_param_types = [
-            list[channel.type],
-            Optional[channel.type] if channel.optional else channel.type,
+            'Optional[JsonableType]' if channel.optional else 'JsonableType'
         ]
-      elif param_name in spec.INPUTS:
-        if channel.type in _VALUE_ARTIFACT_TO_TYPE:
-          # Primitvie ValueArtifact input can be annotated as a primitive type.
-          primitive_type = _VALUE_ARTIFACT_TO_TYPE[channel.type]
-          allowed_param_types.append(
-              Optional[primitive_type] if channel.optional else primitive_type
-          )
-        else:
-          # JsonValue artifact type.
-          is_param_optional, inner_param_type = (
-              pure_typing_utils.maybe_unwrap_optional(param_type)
-          )
-          if (
-              json_compat.is_json_compatible(inner_param_type)
-              and is_param_optional == channel.optional
-          ):
-            continue  # Type check okay
-          else:
-            allowed_param_types.append(
-                'Optional[JsonableType]' if channel.optional else 'JsonableType'
-            )
-            raise TypeError(
-                f'Parameter type mismatched {param_name}: {param_type} from the'
-                f' executable function {fn.__name__}. The allowed'
-                f' types are {allowed_param_types}.'
-            )
 
       # TODO(wssong): We should care for AsyncOutputArtifact type annotation for
       # channels with is_async=True (go/tflex-list-output).
 
-      if param_type not in allowed_param_types:
-        raise TypeError(
-            f'Parameter type mismatched {param_name}: {param_type} from the'
-            f' executable function {fn.__name__}. The allowed'
-            f' types are {allowed_param_types}.'
-        )
-    elif param_name in spec.PARAMETERS:
-      exec_prop = spec.PARAMETERS[param_name]
-
-      allowed_param_types = [
-          Optional[exec_prop.type] if exec_prop.optional else exec_prop.type
-      ]
-
       if param_type not in allowed_param_types:
         raise TypeError(
             f'Parameter type mismatched {param_name}: {param_type} from the'
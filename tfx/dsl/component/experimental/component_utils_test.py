@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for tfx.dsl.component.experimental.component_utils."""
 
+import inspect
 from typing import Any, Callable, Optional
 
 import tensorflow as tf
@@ -112,6 +113,40 @@ class ComponentUtilsTest(tf.test.TestCase):
 
     self._assert_type_check_execution_function_params_ok(execution)
 
+  def test_type_check_valid_bound_methods(self):
+
+    class Hooks:
+
+      @classmethod
+      def class_execution(cls, input_model: _Model, output_model: _Model):
+        del cls, input_model, output_model
+
+      def execution(self, input_model: _Model, output_model: _Model):
+        del self, input_model, output_model
+
+    self._assert_type_check_execution_function_params_ok(
+        Hooks.class_execution
+    )
+    self._assert_type_check_execution_function_params_ok(Hooks().execution)
+
+  def test_type_check_follows_signature_order(self):
+
+    def execution(
+        input_model: _Model,
+        *input_integer: str,
+        output_model: _Examples,
+        **output_integer: str,
+    ):
+      del input_model, input_integer, output_model, output_integer
+
+    self.assertEqual(
+        list(inspect.signature(execution).parameters),
+        list(component_utils._get_param_annotations(execution)),
+    )
+    # `*input_integer` is checked before the keyword-only `output_model`.
+    with self.assertRaisesRegex(TypeError, 'mismatched input_integer'):
+      self._assert_type_check_execution_function_params_ok(execution)
+
   def test_type_check_raises_error_invalid_types(self):
 
     def execution_param_int(param_int: str):
@@ -16,11 +16,11 @@
 Experimental: no backwards compatibility guarantees.
 """
 
-import copy
 import functools
+import inspect
 import types
 import typing
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Protocol, Type, Union
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Protocol, Tuple, Type, Union
 
 from tfx import types as tfx_types
 from tfx.dsl.component.experimental import function_parser
@@ -42,109 +42,262 @@ except Exception:  # pylint: disable=broad-exception-caught
   _BeamPipeline = Any
 
 
-def _extract_func_args(
-    obj: str,
-    arg_formats: Dict[str, int],
+# Returned by argument extractors for optional arguments that are not passed to
+# the component function.
+_OMITTED = object()
+
+# Shared default for missing channels in the singleton extractors below, which
+# only read it. Never hand it to user code.
+_NO_ARTIFACTS: List[tfx_types.Artifact] = []
+
+
+def _extract_input_artifact(
+    name: str,
+    obj: Any,
+    has_default: bool,
+    input_dict: Dict[str, List[tfx_types.Artifact]],
+    output_dict: Dict[str, List[tfx_types.Artifact]],
+    exec_properties: Dict[str, Any],
+    beam_pipeline: Optional[_BeamPipeline],
+) -> Any:
+  """Extracts an argument of format `ArgFormats.INPUT_ARTIFACT`."""
+  del output_dict, exec_properties, beam_pipeline  # Unused.
+  input_list = input_dict.get(name, _NO_ARTIFACTS)
+  if len(input_list) == 1:
+    return input_list[0]
+  elif not input_list and has_default:
+    # Do not pass the missing optional input.
+    return _OMITTED
+  else:
+    raise ValueError(
+        f'Expected input {name!r} to {obj} to be a singleton ValueArtifact '
+        f'channel (got {input_list} instead).')
+
+
+def _extract_list_input_artifacts(
+    name: str,
+    obj: Any,
+    has_default: bool,
+    input_dict: Dict[str, List[tfx_types.Artifact]],
+    output_dict: Dict[str, List[tfx_types.Artifact]],
+    exec_properties: Dict[str, Any],
+    beam_pipeline: Optional[_BeamPipeline],
+) -> Any:
+  """Extracts an argument of format `ArgFormats.LIST_INPUT_ARTIFACTS`."""
+  del obj, has_default, output_dict, exec_properties, beam_pipeline  # Unused.
+  # A fresh list, since the component function owns the value it receives.
+  return input_dict.get(name, [])
+
+
+def _extract_output_artifact(
+    name: str,
+    obj: Any,
+    has_default: bool,
+    input_dict: Dict[str, List[tfx_types.Artifact]],
+    output_dict: Dict[str, List[tfx_types.Artifact]],
+    exec_properties: Dict[str, Any],
+    beam_pipeline: Optional[_BeamPipeline],
+) -> Any:
+  """Extracts an argument of format `ArgFormats.OUTPUT_ARTIFACT`."""
+  del has_default, input_dict, exec_properties, beam_pipeline  # Unused.
+  output_list = output_dict.get(name, _NO_ARTIFACTS)
+  if len(output_list) == 1:
+    return output_list[0]
+  else:
+    raise ValueError(
+        f'Expected output {name!r} to {obj} to be a singleton ValueArtifact '
+        f'channel (got {output_list} instead).')
+
+
+def _extract_artifact_value(
+    name: str,
+    obj: Any,
+    has_default: bool,
+    input_dict: Dict[str, List[tfx_types.Artifact]],
+    output_dict: Dict[str, List[tfx_types.Artifact]],
+    exec_properties: Dict[str, Any],
+    beam_pipeline: Optional[_BeamPipeline],
+) -> Any:
+  """Extracts an argument of format `ArgFormats.ARTIFACT_VALUE`."""
+  del output_dict, exec_properties, beam_pipeline  # Unused.
+  input_list = input_dict.get(name, _NO_ARTIFACTS)
+  if len(input_list) == 1:
+    return input_list[0].value
+  elif not input_list and has_default:
+    # Do not pass the missing optional input.
+    return _OMITTED
+  else:
+    raise ValueError(
+        f'Expected input {name!r} to {obj} to be a singleton ValueArtifact '
+        f'channel (got {input_list} instead).')
+
+
+def _extract_parameter(
+    name: str,
+    obj: Any,
+    has_default: bool,
+    input_dict: Dict[str, List[tfx_types.Artifact]],
+    output_dict: Dict[str, List[tfx_types.Artifact]],
+    exec_properties: Dict[str, Any],
+    beam_pipeline: Optional[_BeamPipeline],
+) -> Any:
+  """Extracts an argument of format `ArgFormats.PARAMETER`."""
+  del input_dict, output_dict, beam_pipeline  # Unused.
+  if name in exec_properties:
+    return exec_properties[name]
+  elif has_default:
+    # Do not pass the missing optional input.
+    return _OMITTED
+  else:
+    raise ValueError(
+        f'Expected non-optional parameter {name!r} of {obj} to be provided, '
+        'but no value was passed.')
+
+
+def _extract_beam_parameter(
+    name: str,
+    obj: Any,
+    has_default: bool,
+    input_dict: Dict[str, List[tfx_types.Artifact]],
+    output_dict: Dict[str, List[tfx_types.Artifact]],
+    exec_properties: Dict[str, Any],
+    beam_pipeline: Optional[_BeamPipeline],
+) -> Any:
+  """Extracts an argument of format `ArgFormats.BEAM_PARAMETER`."""
+  del name, obj, has_default, input_dict, output_dict  # Unused.
+  del exec_properties  # Unused.
+  return beam_pipeline
+
+
+# Maps each supported `utils.ArgFormats` value to its argument extractor.
+_ARG_EXTRACTORS = {
+    utils.ArgFormats.INPUT_ARTIFACT: _extract_input_artifact,
+    utils.ArgFormats.LIST_INPUT_ARTIFACTS: _extract_list_input_artifacts,
+    utils.ArgFormats.OUTPUT_ARTIFACT: _extract_output_artifact,
+    utils.ArgFormats.ARTIFACT_VALUE: _extract_artifact_value,
+    utils.ArgFormats.PARAMETER: _extract_parameter,
+    utils.ArgFormats.BEAM_PARAMETER: _extract_beam_parameter,
+}
+
+
+class _ArgExtraction(NamedTuple):
+  """How to extract one argument of the decorated function.
+
+  Attributes:
+    name: The argument name.
+    arg_format: The `utils.ArgFormats` value of the argument.
+    extractor: The argument extractor, or None if `arg_format` is unknown.
+    has_default: Whether the argument has a default value.
+  """
+  name: str
+  arg_format: Any
+  extractor: Optional[Callable[..., Any]]
+  has_default: bool
+
+
+class _ReturnedValue(NamedTuple):
+  """A primitive type value returned from the decorated function.
+
+  Attributes:
+    name: The output name.
+    is_optional: Whether the returned value is nullable.
+    json_typehint: The annotation of the output if it is declared as a json
+      compatible type, otherwise None.
+  """
+  name: str
+  is_optional: bool
+  json_typehint: Any
+
+
+def _make_extraction_plan(
+    arg_formats: Dict[str, Any],
     arg_defaults: Dict[str, Any],
+) -> Tuple[_ArgExtraction, ...]:
+  """Resolves the extractor of each argument of the decorated function.
+
+  Args:
+    arg_formats: A dict from arg name to its `utils.ArgFormats` value.
+    arg_defaults: A dict from optional arg name to its default value.
+
+  Returns:
+    An `_ArgExtraction` for each arg, in argument order.
+  """
+  plan = []
+  for name, arg_format in arg_formats.items():
+    if (arg_format == utils.ArgFormats.BEAM_PARAMETER and
+        arg_defaults.get(name) is not None):
+      raise ValueError('beam Pipeline parameter does not allow default ',
+                       'value other than None.')
+    plan.append(
+        _ArgExtraction(
+            name=name,
+            arg_format=arg_format,
+            extractor=_ARG_EXTRACTORS.get(arg_format),
+            has_default=name in arg_defaults))
+  return tuple(plan)
+
+
+def _extract_func_args(
+    obj: Any,
+    extraction_plan: Tuple[_ArgExtraction, ...],
     input_dict: Dict[str, List[tfx_types.Artifact]],
     output_dict: Dict[str, List[tfx_types.Artifact]],
     exec_properties: Dict[str, Any],
     beam_pipeline: Optional[_BeamPipeline] = None,
 ) -> Dict[str, Any]:
-  """Extracts function arguments for the decorated function."""
+  """Extracts function arguments for the decorated function.
+
+  `obj` identifies the caller in error messages and is only formatted when an
+  argument cannot be extracted.
+  """
   result = {}
-  for name, arg_format in arg_formats.items():
-    if arg_format == utils.ArgFormats.INPUT_ARTIFACT:
-      input_list = input_dict.get(name, [])
-      if len(input_list) == 1:
-        result[name] = input_list[0]
-      elif not input_list and name in arg_defaults:
-        # Do not pass the missing optional input.
-        pass
-      else:
-        raise ValueError(
-            ('Expected input %r to %s to be a singleton ValueArtifact channel '
-             '(got %s instead).') % (name, obj, input_list))
-    elif arg_format == utils.ArgFormats.LIST_INPUT_ARTIFACTS:
-      result[name] = input_dict.get(name, [])
-    elif arg_format == utils.ArgFormats.OUTPUT_ARTIFACT:
-      output_list = output_dict.get(name, [])
-      if len(output_list) == 1:
-        result[name] = output_list[0]
-      else:
-        raise ValueError(
-            ('Expected output %r to %s to be a singleton ValueArtifact channel '
-             '(got %s instead).') % (name, obj, output_list))
-    elif arg_format == utils.ArgFormats.ARTIFACT_VALUE:
-      input_list = input_dict.get(name, [])
-      if len(input_list) == 1:
-        result[name] = input_list[0].value
-      elif not input_list and name in arg_defaults:
-        # Do not pass the missing optional input.
-        pass
-      else:
-        raise ValueError(
-            ('Expected input %r to %s to be a singleton ValueArtifact channel '
-             '(got %s instead).') % (name, obj, input_list))
-    elif arg_format == utils.ArgFormats.PARAMETER:
-      if name in exec_properties:
-        result[name] = exec_properties[name]
-      elif name in arg_defaults:
-        # Do not pass the missing optional input.
-        pass
-      else:
-        raise ValueError(
-            ('Expected non-optional parameter %r of %s to be provided, but no '
-             'value was passed.') % (name, obj))
-    elif arg_format == utils.ArgFormats.BEAM_PARAMETER:
-      result[name] = beam_pipeline
-      if name in arg_defaults and arg_defaults[name] is not None:
-        raise ValueError('beam Pipeline parameter does not allow default ',
-                         'value other than None.')
-    else:
-      raise ValueError('Unknown argument format: %r' % (arg_format,))
+  for name, arg_format, extractor, has_default in extraction_plan:
+    if extractor is None:
+      raise ValueError(f'Unknown argument format: {arg_format!r}')
+    value = extractor(name, obj, has_default, input_dict, output_dict,
+                      exec_properties, beam_pipeline)
+    if value is not _OMITTED:
+      result[name] = value
   return result
 
 
 def _assign_returned_values(
     function,
     outputs: Dict[str, Any],
-    returned_values: Dict[str, Any],
+    returned_values: Tuple[_ReturnedValue, ...],
     output_dict: Dict[str, List[tfx_types.Artifact]],
-    json_typehints: Dict[str, Type],  # pylint: disable=g-bare-generic
-) -> Dict[str, List[tfx_types.Artifact]]:
-  """Validates and assigns the outputs to the output_dict."""
-  result = copy.deepcopy(output_dict)
+) -> None:
+  """Validates and assigns the outputs to the artifacts in output_dict."""
   if not isinstance(outputs, dict):
     raise ValueError(
-        ('Expected component executor function %s to return a dict of '
-         'outputs (got %r instead).') % (function, outputs))
+        f'Expected component executor function {function} to return a dict '
+        f'of outputs (got {outputs!r} instead).')
 
   # Assign returned ValueArtifact values.
-  for name, is_optional in returned_values.items():
+  for name, is_optional, json_typehint in returned_values:
     if name not in outputs:
       raise ValueError(
-          'Did not receive expected output %r as return value from '
-          'component executor function %s.' % (name, function))
-    if not is_optional and outputs[name] is None:
-      raise ValueError('Non-nullable output %r received None return value from '
-                       'component executor function %s.' % (name, function))
+          f'Did not receive expected output {name!r} as return value from '
+          f'component executor function {function}.')
+    value = outputs[name]
+    if not is_optional and value is None:
+      raise ValueError(
+          f'Non-nullable output {name!r} received None return value from '
+          f'component executor function {function}.')
+    output_artifact = output_dict[name][0]
     try:
-      result[name][0].value = outputs[name]
+      output_artifact.value = value
     except TypeError as e:
       raise TypeError(
-          ('Return value %r for output %r is incompatible with output type '
-           '%r.') %
-          (outputs[name], name, result[name][0].__class__)) from e
+          f'Return value {value!r} for output {name!r} is incompatible with '
+          f'output type {type(output_artifact).__name__}.') from e
     # Handle JsonValue runtime type check.
-    if name in json_typehints:
-      ret = json_compat.check_strict_json_compat(outputs[name],
-                                                 json_typehints[name])
+    if json_typehint is not None:
+      ret = json_compat.check_strict_json_compat(value, json_typehint)
       if not ret:
         raise TypeError(
-            ('Return value %r for output %r is incompatible with output type '
-             '%r.') % (outputs[name], name, json_typehints[name]))
-  return result
+            f'Return value {value!r} for output {name!r} is incompatible with '
+            f'output type {json_typehint!r}.')
 
 
 class BaseFunctionalComponent(base_component.BaseComponent):
@@ -171,43 +324,83 @@ class BaseFunctionalComponentFactory(Protocol):
 class _SimpleComponent(BaseFunctionalComponent):
   """Component whose constructor generates spec instance from arguments."""
 
+  # Views of `SPEC_CLASS` used by the constructor, resolved when the component
+  # class is created.
+
+  # Whether the views below have been resolved from `SPEC_CLASS`.
+  _SPEC_VIEWS_RESOLVED = False
+  # Names of all inputs and parameters of the spec.
+  _ARG_KEYS = frozenset()
+  # Name and type of each non-optional input and parameter.
+  _REQUIRED_INPUTS = ()
+  _REQUIRED_PARAMETERS = ()
+  # Name, artifact type and JSON compatible typehint (or None) of each output.
+  _OUTPUTS = ()
+
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    spec_class = cls.SPEC_CLASS
+    if (inspect.isclass(spec_class) and
+        issubclass(spec_class, tfx_types.ComponentSpec)):
+      cls._resolve_spec_views()
+    else:
+      # Abstract subclasses, e.g. `_SimpleBeamComponent`, have no spec yet. An
+      # invalid `SPEC_CLASS` is reported when the component is instantiated.
+      cls._SPEC_VIEWS_RESOLVED = False
+
+  @classmethod
+  def _resolve_spec_views(cls):
+    spec_class = cls.SPEC_CLASS
+    cls._ARG_KEYS = frozenset(spec_class.INPUTS).union(spec_class.PARAMETERS)
+    cls._REQUIRED_INPUTS = tuple(
+        (key, channel_parameter.type)
+        for key, channel_parameter in spec_class.INPUTS.items()
+        if not channel_parameter.optional)
+    cls._REQUIRED_PARAMETERS = tuple(
+        (key, parameter.type)
+        for key, parameter in spec_class.PARAMETERS.items()
+        if not parameter.optional)
+    cls._OUTPUTS = tuple(
+        (key, channel_parameter.type,
+         getattr(channel_parameter, '_JSON_COMPAT_TYPEHINT', None))
+        for key, channel_parameter in spec_class.OUTPUTS.items())
+    cls._SPEC_VIEWS_RESOLVED = True
+
   def __init__(self, *unused_args, **kwargs):
+    cls = self.__class__
+    if not cls._SPEC_VIEWS_RESOLVED:
+      # Raises a descriptive error if `SPEC_CLASS` is still not a spec class.
+      cls._validate_component_class()
+      cls._resolve_spec_views()
     if unused_args:
       raise ValueError(('%s expects arguments to be passed as keyword '
-                        'arguments') % (self.__class__.__name__,))
-    spec_kwargs = {}
-    unseen_args = set(kwargs.keys())
-    for key, channel_parameter in self.SPEC_CLASS.INPUTS.items():
-      if key not in kwargs and not channel_parameter.optional:
+                        'arguments') % (cls.__name__,))
+    for key, channel_type in cls._REQUIRED_INPUTS:
+      if key not in kwargs:
         raise ValueError('%s expects input %r to be a Channel of type %s.' %
-                         (self.__class__.__name__, key, channel_parameter.type))
-      if key in kwargs:
-        spec_kwargs[key] = kwargs[key]
-        unseen_args.remove(key)
-    for key, parameter in self.SPEC_CLASS.PARAMETERS.items():
-      if key not in kwargs and not parameter.optional:
+                         (cls.__name__, key, channel_type))
+    for key, parameter_type in cls._REQUIRED_PARAMETERS:
+      if key not in kwargs:
         raise ValueError('%s expects parameter %r of type %s.' %
-                         (self.__class__.__name__, key, parameter.type))
-      if key in kwargs:
-        spec_kwargs[key] = kwargs[key]
-        unseen_args.remove(key)
+                         (cls.__name__, key, parameter_type))
+    unseen_args = kwargs.keys() - cls._ARG_KEYS
     if unseen_args:
       raise ValueError(
           'Unknown arguments to %r: %s.' %
-          (self.__class__.__name__, ', '.join(sorted(unseen_args))))
-    for key, channel_parameter in self.SPEC_CLASS.OUTPUTS.items():
-      artifact = channel_parameter.type()
-      spec_kwargs[key] = channel.OutputChannel(artifact.type, self,
-                                               key).set_artifacts([artifact])
-      json_compat_typehint = getattr(channel_parameter, '_JSON_COMPAT_TYPEHINT',
-                                     None)
+          (cls.__name__, ', '.join(sorted(unseen_args))))
+    spec_kwargs = dict(kwargs)
+    for key, artifact_type, json_compat_typehint in cls._OUTPUTS:
+      artifact = artifact_type()
+      output_channel = channel.OutputChannel(artifact.type, self,
+                                             key).set_artifacts([artifact])
       if json_compat_typehint:
-        setattr(spec_kwargs[key], '_JSON_COMPAT_TYPEHINT', json_compat_typehint)
-    spec = self.SPEC_CLASS(**spec_kwargs)
+        output_channel._JSON_COMPAT_TYPEHINT = json_compat_typehint  # pylint: disable=protected-access
+      spec_kwargs[key] = output_channel
+    spec = cls.SPEC_CLASS(**spec_kwargs)
     super().__init__(spec)
     # Set class name, which is the decorated function name, as the default id.
     # It can be overwritten by the user.
-    self._id = self.__class__.__name__
+    self._id = cls.__name__
 
 
 class _SimpleBeamComponent(_SimpleComponent,
@@ -238,58 +431,61 @@ class _FunctionExecutor(base_executor.BaseExecutor):
   # A dictionary mapping output names that are declared
   # as json compatible types to the annotation.
   _RETURN_JSON_COMPAT_TYPEHINT = {}
+  # Extractor of each function argument, resolved from `_ARG_FORMATS` and
+  # `_ARG_DEFAULTS` when the executor class is created. See
+  # `_make_extraction_plan()`.
+  _EXTRACTION_PLAN = ()
+  # `_RETURNED_VALUES` and `_RETURN_JSON_COMPAT_TYPEHINT` as a tuple of
+  # `_ReturnedValue`, resolved when the executor class is created.
+  _RETURN_PLAN = ()
+
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    cls._EXTRACTION_PLAN = _make_extraction_plan(cls._ARG_FORMATS,
+                                                 cls._ARG_DEFAULTS)
+    # `utils.create_component_class()` may leave the returned values unset.
+    return_json_typehints = cls._RETURN_JSON_COMPAT_TYPEHINT or {}
+    cls._RETURN_PLAN = tuple(
+        _ReturnedValue(
+            name=name,
+            is_optional=is_optional,
+            json_typehint=return_json_typehints.get(name))
+        for name, is_optional in (cls._RETURNED_VALUES or {}).items())
+
+  def _make_function_beam_pipeline(self) -> Optional[_BeamPipeline]:
+    """Returns the Beam pipeline for `BeamComponentParameter` arguments."""
+    return None
 
   def Do(self, input_dict: Dict[str, List[tfx_types.Artifact]],
          output_dict: Dict[str, List[tfx_types.Artifact]],
          exec_properties: Dict[str, Any]) -> None:
     function_args = _extract_func_args(
-        obj=str(self),
-        arg_formats=self._ARG_FORMATS,
-        arg_defaults=self._ARG_DEFAULTS,
+        obj=self,
+        extraction_plan=self._EXTRACTION_PLAN,
         input_dict=input_dict,
         output_dict=output_dict,
-        exec_properties=exec_properties)
+        exec_properties=exec_properties,
+        beam_pipeline=self._make_function_beam_pipeline())
 
     # Call function and check returned values.
     outputs = self._FUNCTION(**function_args)
-    outputs = outputs or {}
-    output_dict.update(
-        _assign_returned_values(
-            function=self._FUNCTION,
-            outputs=outputs,
-            returned_values=self._RETURNED_VALUES,
-            output_dict=output_dict,
-            json_typehints=self._RETURN_JSON_COMPAT_TYPEHINT,
-        ))
+    # Components without returned values usually return None, in which case
+    # there is nothing to validate or assign.
+    if outputs or self._RETURN_PLAN:
+      _assign_returned_values(
+          function=self._FUNCTION,
+          outputs=outputs or {},
+          returned_values=self._RETURN_PLAN,
+          output_dict=output_dict,
+      )
 
 
 class _FunctionBeamExecutor(base_beam_executor.BaseBeamExecutor,
                             _FunctionExecutor):
   """Base class for function-based executors."""
 
-  def Do(self, input_dict: Dict[str, List[tfx_types.Artifact]],
-         output_dict: Dict[str, List[tfx_types.Artifact]],
-         exec_properties: Dict[str, Any]) -> None:
-    function_args = _extract_func_args(
-        obj=str(self),
-        arg_formats=self._ARG_FORMATS,
-        arg_defaults=self._ARG_DEFAULTS,
-        input_dict=input_dict,
-        output_dict=output_dict,
-        exec_properties=exec_properties,
-        beam_pipeline=self._make_beam_pipeline())
-
-    # Call function and check returned values.
-    outputs = self._FUNCTION(**function_args)
-    outputs = outputs or {}
-    output_dict.update(
-        _assign_returned_values(
-            function=self._FUNCTION,
-            outputs=outputs,
-            returned_values=self._RETURNED_VALUES,
-            output_dict=output_dict,
-            json_typehints=self._RETURN_JSON_COMPAT_TYPEHINT,
-        ))
+  def _make_function_beam_pipeline(self) -> Optional[_BeamPipeline]:
+    return self._make_beam_pipeline()
 
 
 @typing.overload
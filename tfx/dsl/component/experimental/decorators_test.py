@@ -25,6 +25,7 @@ from tfx.dsl.component.experimental.annotations import InputArtifact
 from tfx.dsl.component.experimental.annotations import OutputArtifact
 from tfx.dsl.component.experimental.annotations import OutputDict
 from tfx.dsl.component.experimental.annotations import Parameter
+from tfx.dsl.component.experimental.decorators import _FunctionExecutor
 from tfx.dsl.component.experimental.decorators import _SimpleBeamComponent
 from tfx.dsl.component.experimental.decorators import _SimpleComponent
 from tfx.dsl.component.experimental.decorators import BaseFunctionalComponent
@@ -393,6 +394,43 @@ class ComponentDecoratorTest(tf.test.TestCase):
     self.assertEqual(instance.outputs['output'].type, _OutputArtifact)
     self.assertEqual(instance.id, 'my_instance')
 
+  def testSimpleComponentArgumentErrors(self):
+
+    class _MySimpleComponent(_SimpleComponent):
+      SPEC_CLASS = _BasicComponentSpec
+      EXECUTOR_SPEC = executor_spec.ExecutorClassSpec(
+          base_executor.BaseExecutor)
+
+    input_channel = types.Channel(type=_InputArtifact)
+    with self.assertRaisesRegex(ValueError, "expects input 'input'"):
+      _MySimpleComponent(folds=10)
+    with self.assertRaisesRegex(ValueError, "expects parameter 'folds'"):
+      _MySimpleComponent(input=input_channel)
+    with self.assertRaisesRegex(ValueError, 'Unknown arguments to .*: bar, foo'):
+      _MySimpleComponent(input=input_channel, folds=10, foo=1, bar=2)
+
+  def testSimpleComponentInvalidSpecClass(self):
+
+    class _NotASpecClass:
+      INPUTS = {}
+      PARAMETERS = {}
+      OUTPUTS = {}
+
+    class _MySimpleComponent(_SimpleComponent):
+      SPEC_CLASS = _NotASpecClass
+      EXECUTOR_SPEC = executor_spec.ExecutorClassSpec(
+          base_executor.BaseExecutor)
+
+    class _MyOtherSimpleComponent(_SimpleComponent):
+      SPEC_CLASS = 'not a class'
+      EXECUTOR_SPEC = executor_spec.ExecutorClassSpec(
+          base_executor.BaseExecutor)
+
+    for component_class in (_MySimpleComponent, _MyOtherSimpleComponent):
+      with self.assertRaisesRegex(
+          TypeError, 'expects SPEC_CLASS property to be a subclass'):
+        component_class(folds=10)
+
   def testSimpleBeamComponent(self):
 
     class _MySimpleBeamComponent(_SimpleBeamComponent):
@@ -746,6 +784,54 @@ class ComponentDecoratorTest(tf.test.TestCase):
     self.assertEqual(_decorated_no_op.test_call, no_op)
     self.assertEqual(_decorated_with_arg_no_op.test_call, no_op)
 
+  def testReturnedValuesAreAssignedToOutputArtifacts(self):
+    fileio.makedirs(os.path.join(self._test_dir, 'input'))
+    fileio.makedirs(os.path.join(self._test_dir, 'output'))
+    input_dict = {}
+    for name, artifact_type, value in (
+        ('a', standard_artifacts.Integer, 1),
+        ('b', standard_artifacts.Integer, 2),
+        ('c', standard_artifacts.String, 'c'),
+        ('d', standard_artifacts.Bytes, b'd'),
+    ):
+      artifact = artifact_type()
+      artifact.uri = os.path.join(self._test_dir, 'input', name)
+      artifact.value = value
+      input_dict[name] = [artifact]
+    output_dict = {}
+    for name, artifact_type in (
+        ('e', standard_artifacts.Float),
+        ('f', standard_artifacts.Float),
+        ('g', standard_artifacts.String),
+        ('h', standard_artifacts.String),
+    ):
+      artifact = artifact_type()
+      artifact.uri = os.path.join(self._test_dir, 'output', name)
+      output_dict[name] = [artifact]
+    original_output_artifacts = {
+        name: artifacts[0] for name, artifacts in output_dict.items()
+    }
+
+    executor = simple_component.EXECUTOR_SPEC.executor_class()
+    executor.Do(input_dict, output_dict, {})
+
+    for name, artifact in original_output_artifacts.items():
+      self.assertIs(output_dict[name][0], artifact)
+    self.assertEqual(output_dict['e'][0].value, 3.0)
+    self.assertEqual(output_dict['f'][0].value, 2.0)
+    self.assertEqual(output_dict['g'][0].value, 'OK')
+    self.assertIsNone(output_dict['h'][0].value)
+
+  def testExecutorWithoutReturnedValues(self):
+
+    class _MyExecutor(_FunctionExecutor):
+      _FUNCTION = staticmethod(lambda: None)
+      _RETURNED_VALUES = None
+      _RETURN_JSON_COMPAT_TYPEHINT = None
+
+    self.assertEqual(_MyExecutor._RETURN_PLAN, ())
+    _MyExecutor().Do({}, {}, {})
+
   def testListOfArtifacts(self):
     """Test execution withl list of artifact inputs and outputs."""
     # pylint: disable=no-value-for-parameter
@@ -22,6 +22,12 @@ def write_anomalies(
     anomalies: anomalies_pb2.Anomalies,
 ) -> None:
   """Writes Anomalies to a binary proto file."""
-  io_utils.write_bytes_file(
-      filepath, anomalies.SerializeToString()
-  )
+  write_anomalies_bytes(filepath, anomalies.SerializeToString())
+
+
+def write_anomalies_bytes(
+    filepath: str,
+    serialized_anomalies: bytes,
+) -> None:
+  """Writes an already serialized Anomalies proto to a binary proto file."""
+  io_utils.write_bytes_file(filepath, serialized_anomalies)
@@ -15,6 +15,7 @@
 
 import os
 from absl import flags
+from absl.testing import parameterized
 import tensorflow as tf
 from tfx.utils import io_utils
 from tfx.utils import writer_utils
@@ -24,9 +25,17 @@ from tensorflow_metadata.proto.v0 import anomalies_pb2
 FLAGS = flags.FLAGS
 
 
-class WriterUtilsTest(tf.test.TestCase):
+def _write_serialized_anomalies(filepath, anomalies):
+  writer_utils.write_anomalies_bytes(filepath, anomalies.SerializeToString())
 
-  def testWriteAnomalies(self):
+
+class WriterUtilsTest(tf.test.TestCase, parameterized.TestCase):
+
+  @parameterized.named_parameters(
+      ('Proto', writer_utils.write_anomalies),
+      ('SerializedProto', _write_serialized_anomalies),
+  )
+  def testWriteAnomalies(self, write_fn):
     anomalies = text_format.Parse(
         """anomaly_info {
                key: "feature_1"
@@ -43,7 +52,7 @@ class WriterUtilsTest(tf.test.TestCase):
               }""",
         anomalies_pb2.Anomalies())
     binary_proto_filepath = os.path.join(FLAGS.test_tmpdir, 'SchemaDiff.pb')
-    writer_utils.write_anomalies(binary_proto_filepath, anomalies)
+    write_fn(binary_proto_filepath, anomalies)
     # Check binary proto file.
     read_binary_anomalies = anomalies_pb2.Anomalies()
     read_binary_anomalies.ParseFromString(